@@ -1,4 +1,5 @@
 import os
+import sys
 import shutil
 
 
@@ -12,6 +13,9 @@ def remove_dir_content(path: str) -> None:
         shutil.rmtree(path)
 
 
-remove_dir_content("_build")
+# NOTE: the _build directory contains the cached doctrees used for incremental
+# builds and is only removed if "--clean" is passed
+if "--clean" in sys.argv[1:]:
+    remove_dir_content("_build")
 remove_dir_content("_generated")
 remove_dir_content("_examples")
@@ -17,26 +17,20 @@
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
 import os
+import re
 import sys
 import shutil
-import numpy as np
-import sphinx_autosummary_accessors
-from click.testing import CliRunner
+import warnings
 from distutils.dir_util import copy_tree
 
 # here = os.path.dirname(__file__)
 # sys.path.insert(0, os.path.abspath(os.path.join(here, "..")))
 
-import hydromt
-from hydromt import DataCatalog
-from hydromt.cli.main import main as hydromt_cli
 
-
-def cli2rst(output, fn):
-    with open(fn, "w") as f:
-        f.write(".. code-block:: console\n\n")
-        for line in output.split("\n"):
-            f.write(f"    {line}\n")
+def read_version(fn):
+    # parse the version without importing hydromt
+    with open(fn, "r") as f:
+        return re.search(r'^__version__ = "(.+)"', f.read(), re.M).group(1)
 
 
 def remove_dir_content(path: str) -> None:
@@ -49,41 +43,6 @@ def remove_dir_content(path: str) -> None:
         shutil.rmtree(path)
 
 
-def write_panel(f, name, content="", level=0, item="dropdown"):
-    pad = "".ljust(level * 3)
-    f.write(f"{pad}.. {item}:: {name}\n")
-    f.write("\n")
-    if content:
-        pad = "".ljust((level + 1) * 3)
-        for line in content.split("\n"):
-            f.write(f"{pad}{line}\n")
-        f.write("\n")
-
-
-def write_nested_dropdown(name, data_cat, note="", categories=[]):
-    df = data_cat.to_dataframe().sort_index().drop_duplicates("path")
-    with open(f"_generated/{name}.rst", mode="w") as f:
-        write_panel(f, name, note, level=0)
-        write_panel(f, "", level=1, item="tab-set")
-        for category in categories:
-            if category == "other":
-                sources = df.index[~np.isin(df["category"], categories)]
-            else:
-                sources = df.index[df["category"] == category]
-            if len(sources) > 0:
-                write_panel(f, category, level=2, item="tab-item")
-            for source in sources:
-                items = data_cat[source].summary().items()
-                summary = "\n".join([f":{k}: {v}" for k, v in items if k != "category"])
-                write_panel(f, source, summary, level=3)
-
-        write_panel(f, "all", level=2, item="tab-item")
-        for source in df.index.values:
-            items = data_cat[source].summary().items()
-            summary = "\n".join([f":{k}: {v}" for k, v in items])
-            write_panel(f, source, summary, level=3)
-
-
 # NOTE: the examples/ folder in the root should be copied to docs/examples/examples/ before running sphinx
 # -- Project information -----------------------------------------------------
 
@@ -92,7 +51,7 @@ copyright = "Deltares"
 author = "Dirk Eilander"
 
 # The short version which is displayed
-version = hydromt.__version__
+version = read_version("../hydromt/__init__.py")
 
 
 # # -- Copy notebooks to include in docs -------
@@ -101,37 +60,14 @@ if os.path.isdir("_examples"):
 os.makedirs("_examples")
 copy_tree("../examples", "_examples")
 
-# # -- Generate panels rst files from data catalogs to include in docs -------
-if not os.path.isdir("_generated"):
-    os.makedirs("_generated")
-
-categories = [
-    "geography",
-    "hydrography",
-    "landuse",
-    "hydro",
-    "meteo",
-    "ocean",
-    "socio-economic",
-    "topography",
-    "other",
-]
-
-# TODO add other data sources
-data_cat = hydromt.DataCatalog(deltares_data=True)
-note = "Only accessible when connected to the Deltares network."
-write_nested_dropdown("deltares_data", data_cat, note=note, categories=categories)
+# -- Generate rst files with data catalog panels and cli help -------
+# NOTE: these files are only (re)generated with generate.py if missing or if
+# HYDROMT_REGEN_DOCS is set; hydromt and its dependencies are only imported then
+if not os.path.isdir("_generated") or os.environ.get("HYDROMT_REGEN_DOCS"):
+    sys.path.insert(0, os.path.abspath("."))
+    from generate import main as generate_rst
 
-# -- Generate cli help docs ----------------------------------------------
-
-cli_build = CliRunner().invoke(hydromt_cli, ["build", "--help"])
-cli2rst(cli_build.output, r"_generated/cli_build.rst")
-
-cli_update = CliRunner().invoke(hydromt_cli, ["update", "--help"])
-cli2rst(cli_update.output, r"_generated/cli_update.rst")
-
-cli_clip = CliRunner().invoke(hydromt_cli, ["clip", "--help"])
-cli2rst(cli_clip.output, r"_generated/cli_clip.rst")
+    generate_rst()
 
 # -- General configuration ------------------------------------------------
 
@@ -151,7 +87,6 @@ extensions = [
     "sphinx.ext.autosummary",
     "sphinx.ext.githubpages",
     "sphinx.ext.intersphinx",
-    "sphinx_autosummary_accessors",
     "IPython.sphinxext.ipython_directive",
     "IPython.sphinxext.ipython_console_highlighting",
     "nbsphinx",
@@ -159,7 +94,17 @@ extensions = [
 
 autosummary_generate = True
 # Add any paths that contain templates here, relative to this directory.
-templates_path = ["_templates", sphinx_autosummary_accessors.templates_path]
+templates_path = ["_templates"]
+try:
+    import sphinx_autosummary_accessors
+
+    extensions.append("sphinx_autosummary_accessors")
+    templates_path.append(sphinx_autosummary_accessors.templates_path)
+except ImportError:
+    warnings.warn(
+        "sphinx_autosummary_accessors not installed: the accessor pages in the api "
+        "reference (e.g. Dataset.raster.*) will be broken."
+    )
 # The suffix(es) of source filenames.
 # You can specify multiple suffix as a list of string:
 #
@@ -341,6 +286,11 @@ intersphinx_mapping = {
 
 # -- NBSPHINX --------------------------------------------------------------
 
+# Executing the notebooks is by far the most expensive part of the build and is
+# therefore skipped by default. Set NBSPHINX_EXECUTE to "always" or "auto" to run
+# the examples.
+nbsphinx_execute = os.environ.get("NBSPHINX_EXECUTE", "never")
+
 # This is processed by Jinja2 and inserted before each notebook
 nbsphinx_prolog = r"""
 {% set docname = env.doc2path(env.docname, base=None).split('\\')[-1].split('/')[-1] %}
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+#
+# Generate the rst files with the data catalog panels and cli help to include in
+# the docs. These files are written to _generated/ and only need to be updated if
+# the data catalog or cli change. The files are created by conf.py if missing or
+# if HYDROMT_REGEN_DOCS is set, or can be updated by running this script:
+#
+#   python generate.py
+#
+import io
+import os
+import numpy as np
+from click.testing import CliRunner
+
+from hydromt import DataCatalog
+from hydromt.cli.main import main as hydromt_cli
+
+here = os.path.dirname(os.path.abspath(__file__))
+gen_root = os.path.join(here, "_generated")
+
+categories = [
+    "geography",
+    "hydrography",
+    "landuse",
+    "hydro",
+    "meteo",
+    "ocean",
+    "socio-economic",
+    "topography",
+    "other",
+]
+
+
+def write_if_changed(fn, content):
+    # only (re)write if the content changed to keep the file modification time,
+    # otherwise sphinx marks all documents which include the file as outdated
+    content = content.encode("utf-8")
+    if os.path.isfile(fn):
+        with open(fn, "rb") as f:
+            if f.read() == content:
+                return
+    with open(fn, "wb") as f:
+        f.write(content)
+
+
+def cli2rst(output, fn):
+    indented = "    " + output.replace("\n", "\n    ")
+    write_if_changed(fn, ".. code-block:: console\n\n" + indented + "\n")
+
+
+def write_panel(f, name, content="", level=0, item="dropdown"):
+    pad = "".ljust(level * 3)
+    f.write(f"{pad}.. {item}:: {name}\n")
+    f.write("\n")
+    if content:
+        pad = "".ljust((level + 1) * 3)
+        for line in content.split("\n"):
+            f.write(f"{pad}{line}\n")
+        f.write("\n")
+
+
+def write_nested_dropdown(name, data_cat, note="", categories=[]):
+    df = data_cat.to_dataframe().sort_index().drop_duplicates("path")
+    # map unlisted categories to "other" at once instead of masking per category
+    category = df["category"].where(np.isin(df["category"], categories), "other")
+    # get the summary of each source only once, it is used in two tabs
+    summaries = {source: data_cat[source].summary() for source in df.index}
+    f = io.StringIO()
+    write_panel(f, name, note, level=0)
+    write_panel(f, "", level=1, item="tab-set")
+    for cat in categories:
+        sources = df.index[category == cat]
+        if len(sources) > 0:
+            write_panel(f, cat, level=2, item="tab-item")
+        for source in sources:
+            items = summaries[source].items()
+            summary = "\n".join([f":{k}: {v}" for k, v in items if k != "category"])
+            write_panel(f, source, summary, level=3)
+
+    write_panel(f, "all", level=2, item="tab-item")
+    for source in df.index.values:
+        items = summaries[source].items()
+        summary = "\n".join([f":{k}: {v}" for k, v in items])
+        write_panel(f, source, summary, level=3)
+    write_if_changed(os.path.join(gen_root, f"{name}.rst"), f.getvalue())
+
+
+def main():
+    if not os.path.isdir(gen_root):
+        os.makedirs(gen_root)
+
+    # -- Generate panels rst files from data catalogs -------
+    # TODO add other data sources
+    # NOTE: set HYDROMT_SKIP_CATALOG to reuse a previously generated file and skip
+    # downloading the deltares data catalog
+    if not (
+        os.environ.get("HYDROMT_SKIP_CATALOG")
+        and os.path.isfile(os.path.join(gen_root, "deltares_data.rst"))
+    ):
+        data_cat = DataCatalog(deltares_data=True)
+        note = "Only accessible when connected to the Deltares network."
+        write_nested_dropdown(
+            "deltares_data", data_cat, note=note, categories=categories
+        )
+
+    # -- Generate cli help docs -------
+    runner = CliRunner()
+    for cmd in ["build", "update", "clip"]:
+        output = runner.invoke(hydromt_cli, [cmd, "--help"]).output
+        cli2rst(output, os.path.join(gen_root, f"cli_{cmd}.rst"))
+
+
+if __name__ == "__main__":
+    main()
@@ -1454,6 +1454,7 @@ class GeoDataFrameAdapter(DataAdapter):
         "csv": "csv",
         "xls": "xls",
         "xlsx": "xlsx",
+        "feather": "feather",
     }
 
     def __init__(
@@ -1555,7 +1556,7 @@ class GeoDataFrameAdapter(DataAdapter):
             return None, None
 
         if driver is None:
-            _lst = ["csv", "xls", "xlsx", "xy", "vector_table"]
+            _lst = ["csv", "xls", "xlsx", "feather", "xy", "vector_table"]
             driver = "csv" if self.driver in _lst else "GPKG"
         # always write netcdf
         if driver == "csv":
@@ -1620,10 +1621,11 @@ class GeoDataFrameAdapter(DataAdapter):
 
         # read and clip
         logger.info(f"GeoDataFrame: Read {self.driver} data{clip_str}.")
-        if self.driver in ["csv", "xls", "xlsx", "xy", "vector", "vector_table"]:
+        table_drivers = ["csv", "xls", "xlsx", "feather", "xy"]
+        if self.driver in table_drivers + ["vector", "vector_table"]:
             # "csv", "xls", "xlsx", "xy" deprecated use vector_table instead.
             # specific driver should be added to open_vector kwargs
-            if "driver" not in kwargs and self.driver in ["csv", "xls", "xlsx", "xy"]:
+            if "driver" not in kwargs and self.driver in table_drivers:
                 kwargs.update(driver=self.driver)
             gdf = io.open_vector(
                 self.path, crs=self.crs, geom=geom, predicate=predicate, **kwargs
@@ -372,19 +372,19 @@ def open_vector(
     logger=logger,
     **kwargs,
 ):
-    """Open fiona-compatible geometry, csv, excel or xy file and
+    """Open fiona-compatible geometry, csv, excel, feather or xy file and
     parse to :py:meth:`geopandas.GeoDataFrame`.
 
-    CSV or XLS file are converted to point geometries based on default columns names
+    CSV, XLS or feather file are converted to point geometries based on default columns names
     for the x- and y-coordinates, or if given, the x_dim and y_dim arguments.
 
     Parameters
     ----------
     fn : str
         path to geometry file
-    driver: {'csv', 'xls', 'xy', 'vector'}, optional
+    driver: {'csv', 'xls', 'feather', 'xy', 'vector'}, optional
         driver used to read the file: :py:meth:`geopandas.open_file` for gdal vector files,
-        :py:meth:`hydromt.io.open_vector_from_table` for csv, xls(x) and xy files.
+        :py:meth:`hydromt.io.open_vector_from_table` for csv, xls(x), feather and xy files.
         By default None, and infered from file extention.
     crs: str, `pyproj.CRS`, or dict
         Source coordinate reference system, ignored for files with a native crs.
@@ -402,7 +402,7 @@ def open_vector(
         the predicate function against each item. Requires bbox or mask.
         By default 'intersects'
     x_dim, y_dim : str
-        Name of x, y-coordinate columns, only applicable for csv or xls tables
+        Name of x, y-coordinate columns, only applicable for csv, xls or feather tables
     assert_gtype : {Point, LineString, Polygon}, optional
         If given, assert geometry type
     mode: {'r', 'a', 'w'}
@@ -417,7 +417,7 @@ def open_vector(
     """
     filtered = False
     driver = driver if driver is not None else str(fn).split(".")[-1].lower()
-    if driver in ["csv", "xls", "xlsx", "xy"]:
+    if driver in ["csv", "xls", "xlsx", "feather", "xy"]:
         gdf = open_vector_from_table(fn, driver=driver, **kwargs)
     else:
         gdf = gpd.read_file(fn, bbox=bbox, mask=geom, mode=mode, **kwargs)
@@ -456,13 +456,15 @@ def open_vector_from_table(
     crs=None,
     **kwargs,
 ):
-    """Read point geometry files from csv, xy or excel table files.
+    """Read point geometry files from csv, xy, feather or excel table files.
 
     Parameters
     ----------
-    driver: {'csv', 'xls', 'xlsx', 'xy'}
+    driver: {'csv', 'xls', 'xlsx', 'feather', 'xy'}
         If 'csv' use :py:meth:`pandas.read_csv` to read the data;
         If 'xls' or 'xlsx' use :py:meth:`pandas.read_excel` with `engine=openpyxl`
+        If 'feather' use :py:meth:`pandas.read_feather` (requires pyarrow), the
+        index is set after reading based on the optional `index_col` argument;
         If 'xy' use :py:meth:`pandas.read_csv` with `index_col=False`, `header=None`, `delim_whitespace=True`.
     x_dim, y_dim: str
         Name of x, y column. By default the x-column header should be one of
@@ -478,12 +480,20 @@ def open_vector_from_table(
         Parsed and filtered point geometries
     """
     driver = driver.lower() if driver is not None else str(fn).split(".")[-1].lower()
-    if "index_col" not in kwargs:
+    if "index_col" not in kwargs and driver != "feather":
         kwargs.update(index_col=0)
     if driver in ["csv"]:
         df = pd.read_csv(fn, **kwargs)
     elif driver in ["xls", "xlsx"]:
         df = pd.read_excel(fn, engine="openpyxl", **kwargs)
+    elif driver in ["feather"]:
+        # NOTE: pandas.read_feather has no index_col argument
+        index_col = kwargs.pop("index_col", None)
+        df = pd.read_feather(fn, **kwargs)
+        if index_col is not None and index_col is not False:
+            df = df.set_index(
+                df.columns[index_col] if isinstance(index_col, int) else index_col
+            )
     elif driver in ["xy"]:
         x_dim = x_dim if x_dim is not None else "x"
         y_dim = y_dim if y_dim is not None else "y"
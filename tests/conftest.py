@@ -8,8 +8,7 @@ from hydromt import raster, vector, gis_utils
 import pyflwdir
 
 
-@pytest.fixture
-def rioda():
+def _make_rioda():
     return raster.full_from_transform(
         transform=[0.5, 0.0, 3.0, 0.0, -0.5, -9.0],
         shape=(4, 6),
@@ -19,9 +18,8 @@ def rioda():
     )
 
 
-@pytest.fixture
-def df():
-    df = pd.DataFrame(
+def _make_df():
+    return pd.DataFrame(
         {
             "city": ["Buenos Aires", "Brasilia", "Santiago", "Bogota", "Caracas"],
             "country": ["Argentina", "Brazil", "Chile", "Colombia", "Venezuela"],
@@ -29,25 +27,58 @@ def df():
             "longitude": [-58.66, -47.91, -70.66, -74.08, -66.86],
         }
     )
-    return df
 
 
-@pytest.fixture
-def geodf(df):
-    gdf = gpd.GeoDataFrame(
+def _make_geodf(df):
+    return gpd.GeoDataFrame(
         data=df.drop(columns=["longitude", "latitude"]),
         geometry=gpd.points_from_xy(df["longitude"], df["latitude"]),
         crs=4326,
     )
-    return gdf
 
 
 @pytest.fixture
+def rioda():
+    return _make_rioda()
+
+
+@pytest.fixture
+def df():
+    return _make_df()
+
+
+@pytest.fixture
+def geodf(df):
+    return _make_geodf(df)
+
+
+@pytest.fixture(scope="session")
 def world():
     world = gpd.read_file(gpd.datasets.get_path("naturalearth_lowres"))
     return world
 
 
+@pytest.fixture(scope="session")
+def chile(world):
+    return world[world["name"] == "Chile"]
+
+
+@pytest.fixture(scope="session")
+def geojson_path(tmp_path_factory):
+    # NOTE: not based on geodf of which the index is updated in place by from_gdf
+    fn = str(tmp_path_factory.mktemp("shared").joinpath("test.geojson"))
+    _make_geodf(_make_df()).to_file(fn, driver="GeoJSON")
+    return fn
+
+
+@pytest.fixture(scope="session")
+def geotiff_path(tmp_path_factory):
+    # NOTE: not based on rioda which is updated in place by to_raster
+    fn = str(tmp_path_factory.mktemp("shared").joinpath("test.tif"))
+    _make_rioda().raster.to_raster(fn, crs=3857, tags={"name": "test"})
+    return fn
+
+
 @pytest.fixture
 def ts(geodf):
     dates = pd.date_range("01-01-2000", "12-31-2000", name="time")
@@ -13,6 +13,9 @@ from hydromt.workflows.basin_mask import get_basin_geometry, parse_region
 
 logger = logging.getLogger("tets_basin")
 
+# NOTE: tests which download the artifact data run on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("artifact_data")
+
 
 def test_region(tmpdir, world, geodf, rioda):
     # model
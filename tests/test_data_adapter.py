@@ -18,6 +18,9 @@ from hydromt.data_adapter import (
 
 TESTDATADIR = join(dirname(abspath(__file__)), "data")
 
+# NOTE: tests which download the artifact data run on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("artifact_data")
+
 
 def test_parser():
     # valid abs root on windows and linux!
@@ -15,62 +15,79 @@ import hydromt
 from hydromt import raster
 
 
-def test_open_vector(tmpdir, df, geodf, world):
-    fn_csv = str(tmpdir.join("test.csv"))
-    fn_xy = str(tmpdir.join("test.xy"))
-    fn_xls = str(tmpdir.join("test.xlsx"))
-    fn_geojson = str(tmpdir.join("test.geojson"))
-    df.to_csv(fn_csv)
-    df.to_excel(fn_xls)
-    geodf.to_file(fn_geojson, driver="GeoJSON")
-    hydromt.write_xy(fn_xy, geodf)
-    # read csv
-    gdf1 = hydromt.open_vector(fn_csv, assert_gtype="Point", crs=4326)
+def _assert_gdf_equal(gdf1, gdf2, **kwargs):
+    pd.testing.assert_frame_equal(
+        gdf1.drop(columns="geometry"), gdf2.drop(columns="geometry"), **kwargs
+    )
+    assert gdf1.geometry.equals(gdf2.geometry)
+
+
+@pytest.mark.parametrize("fmt", ["csv", "feather"])
+def test_open_vector(fmt, tmpdir, df, geodf, chile, geojson_path):
+    if fmt == "feather":
+        pytest.importorskip("pyarrow")
+    fn_tbl = str(tmpdir.join(f"test.{fmt}"))
+    if fmt == "csv":
+        df.to_csv(fn_tbl)
+    else:
+        df.to_feather(fn_tbl)
+    # read table
+    gdf1 = hydromt.open_vector(fn_tbl, assert_gtype="Point", crs=4326)
     assert gdf1.crs == geodf.crs
-    assert np.all(gdf1 == geodf)
+    _assert_gdf_equal(gdf1, geodf)
+    # set index
+    gdf1 = hydromt.open_vector(fn_tbl, crs=4326, index_col="city")
+    assert np.array_equal(gdf1.index, df["city"])
     # no data in domain
-    gdf1 = hydromt.open_vector(fn_csv, crs=4326, bbox=[200, 300, 200, 300])
+    gdf1 = hydromt.open_vector(fn_tbl, crs=4326, bbox=[200, 300, 200, 300])
     assert gdf1.index.size == 0
-    # read xls
-    gdf1 = hydromt.open_vector(fn_xls, assert_gtype="Point", crs=4326)
-    assert np.all(gdf1 == geodf)
-    # read xy
-    gdf1 = hydromt.open_vector(fn_xy, crs=4326)
-    assert np.all(gdf1 == geodf[["geometry"]])
     # filter
-    country = "Chile"
-    geom = world[world["name"] == country]
     gdf1 = hydromt.open_vector(
-        fn_csv, crs=4326, geom=geom.to_crs(3857)
+        fn_tbl, crs=4326, geom=chile.to_crs(3857)
     )  # crs should default to 4326
-    assert np.all(gdf1["country"] == country)
-    gdf2 = hydromt.open_vector(fn_geojson, geom=geom)
-    # NOTE labels are different
-    assert np.all(gdf1.geometry.values == gdf2.geometry.values)
-    gdf2 = hydromt.open_vector(fn_csv, crs=4326, bbox=geom.total_bounds)
-    assert np.all(gdf1.geometry.values == gdf2.geometry.values)
+    assert np.all(gdf1["country"] == "Chile")
+    gdf2 = hydromt.open_vector(fn_tbl, crs=4326, bbox=chile.total_bounds)
+    assert gdf1.geometry.reset_index(drop=True).equals(
+        gdf2.geometry.reset_index(drop=True)
+    )
+    if fmt == "csv":
+        fn_xy = str(tmpdir.join("test.xy"))
+        fn_xls = str(tmpdir.join("test.xlsx"))
+        df.to_excel(fn_xls)
+        hydromt.write_xy(fn_xy, geodf)
+        # read xls
+        gdf3 = hydromt.open_vector(fn_xls, assert_gtype="Point", crs=4326)
+        _assert_gdf_equal(gdf3, geodf)
+        # read xy
+        gdf3 = hydromt.open_vector(fn_xy, crs=4326)
+        _assert_gdf_equal(gdf3, geodf[["geometry"]])
+        # filter geojson
+        gdf3 = hydromt.open_vector(geojson_path, geom=chile)
+        # NOTE labels are different
+        assert gdf1.geometry.reset_index(drop=True).equals(
+            gdf3.geometry.reset_index(drop=True)
+        )
     # error
     with pytest.raises(ValueError, match="other geometries"):
-        hydromt.open_vector(fn_csv, assert_gtype="Polygon")
+        hydromt.open_vector(fn_tbl, assert_gtype="Polygon")
     with pytest.raises(ValueError, match="unknown"):
-        hydromt.open_vector(fn_csv, assert_gtype="PolygonPoints")
+        hydromt.open_vector(fn_tbl, assert_gtype="PolygonPoints")
     with pytest.raises(ValueError, match="The GeoDataFrame has no CRS"):
-        hydromt.open_vector(fn_csv)
+        hydromt.open_vector(fn_tbl)
     with pytest.raises(ValueError, match="Unknown geometry mask type"):
-        hydromt.open_vector(fn_csv, crs=4326, geom=geom.total_bounds)
+        hydromt.open_vector(fn_tbl, crs=4326, geom=chile.total_bounds)
     with pytest.raises(ValueError, match="x dimension"):
-        hydromt.open_vector(fn_csv, x_dim="x")
+        hydromt.open_vector(fn_tbl, x_dim="x")
     with pytest.raises(ValueError, match="y dimension"):
-        hydromt.open_vector(fn_csv, y_dim="y")
+        hydromt.open_vector(fn_tbl, y_dim="y")
     with pytest.raises(IOError, match="No such file"):
-        hydromt.open_vector("fail.csv")
+        hydromt.open_vector(f"fail.{fmt}")
     with pytest.raises(IOError, match="Driver fail unknown"):
         hydromt.open_vector_from_table("test.fail")
 
 
-def test_open_geodataset(tmpdir, geodf):
-    fn_gdf = str(tmpdir.join("points.geojson"))
-    geodf.to_file(fn_gdf, driver="GeoJSON")
+def test_open_geodataset(tmpdir, geodf, geojson_path):
+    fn_gdf = geojson_path
     # create zeros timeseries
     ts = pd.DataFrame(
         index=pd.DatetimeIndex(["01-01-2000", "01-01-2001"]),
@@ -85,7 +102,9 @@ def test_open_geodataset(tmpdir, geodf):
     assert isinstance(ds, xr.Dataset)
     assert len(ds.data_vars) == 0
     geodf1 = ds.vector.to_gdf()
-    assert np.all(geodf == geodf1[geodf.columns])
+    # the unnamed index is parsed to the default "index" dimension
+    assert geodf1.index.name == "index"
+    _assert_gdf_equal(geodf, geodf1[geodf.columns].rename_axis(None))
     # add timeseries
     ds = hydromt.open_geodataset(fn_gdf, fn_ts)
     assert name in ds.data_vars
@@ -110,7 +129,7 @@ def test_timeseries_io(tmpdir, ts):
     ts.to_csv(fn_ts2)
     da2 = hydromt.open_timeseries_from_table(fn_ts2)
     assert da.time.dtype.type.__name__ == "datetime64"
-    assert np.all(da == da2)
+    xr.testing.assert_equal(da, da2)
     # no time index
     fn_ts3 = str(tmpdir.join(f"test3.csv"))
     pd.DataFrame(ts.values).to_csv(fn_ts3)
@@ -122,8 +141,8 @@ def test_timeseries_io(tmpdir, ts):
     fn_ts4 = str(tmpdir.join(f"test4.csv"))
     ts.to_csv(fn_ts4)
     da4 = hydromt.open_timeseries_from_table(fn_ts4)
-    assert np.all(da == da4)
-    assert np.all(da.index == da4.index)
+    xr.testing.assert_equal(da, da4)
+    assert np.array_equal(da.index, da4.index)
     # no numeric index
     cols[0] = "a"
     ts.columns = cols
@@ -133,23 +152,23 @@ def test_timeseries_io(tmpdir, ts):
         hydromt.open_timeseries_from_table(fn_ts5)
 
 
-def test_raster_io(tmpdir, rioda):
+def test_raster_io(tmpdir, rioda, geotiff_path):
     da = rioda
-    fn_tif = str(tmpdir.join("test.tif"))
     # to_raster / open_raster
-    da.raster.to_raster(fn_tif, crs=3857, tags={"name": "test"})
+    fn_tif = geotiff_path
     assert os.path.isfile(fn_tif)
-    assert np.all(hydromt.open_raster(fn_tif).values == da.values)
+    assert np.array_equal(hydromt.open_raster(fn_tif).values, da.values)
     with rasterio.open(fn_tif, "r") as src:
         assert src.tags()["name"] == "test"
         assert src.crs.to_epsg() == 3857
     da1 = hydromt.open_raster(fn_tif, mask_nodata=True)
     assert np.any(np.isnan(da1.values))
     # TODO window needs checking & better testing
-    fn_tif = str(tmpdir.join("test1.tif"))
-    da1.raster.to_raster(fn_tif, nodata=-9999, windowed=True)
-    da2 = hydromt.open_raster(fn_tif)
-    assert not np.any(np.isnan(da2.values))
+    # NOTE: in-memory file, only files which are globbed below need to be on disk
+    with rasterio.MemoryFile(ext=".tif") as mem:
+        da1.raster.to_raster(mem.name, nodata=-9999, windowed=True)
+        da2 = hydromt.open_raster(mem.name)
+        assert not np.any(np.isnan(da2.values))
     fn_tif = str(tmpdir.join("test_2.tif"))
     da1.expand_dims("t").round(0).astype(np.int32).raster.to_raster(
         fn_tif, dtype=np.int32
@@ -201,6 +220,9 @@ def test_rasterio_errors(tmpdir, rioda):
 
 
 @pytest.mark.skipif(not hydromt.HAS_PCRASTER, reason="PCRaster not installed.")
+# NOTE: the xdist group keeps all PCRaster writers on the same pytest-xdist worker;
+# this is the only one for now, the group is a guard for future PCRaster tests
+@pytest.mark.xdist_group("pcraster")
 def test_io_pcr(tmpdir):
     # test write ldd with clone
     da = raster.full_from_transform(
@@ -20,6 +20,9 @@ from hydromt.models import MODELS
 from hydromt.models.model_api import Model
 from hydromt.cli.cli_utils import parse_config
 
+# NOTE: tests which download the artifact data run on the same pytest-xdist worker
+pytestmark = pytest.mark.xdist_group("artifact_data")
+
 
 def _rand_float(shape, dtype=np.float32):
     return np.random.rand(*shape).astype(dtype)